@@ -127,3 +127,25 @@ def qn(namespace_prefixed_tag: str) -> str:
     """
     nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
     return nsptag.clark_name
+
+
+class Tags:
+    """Clark-notation names of frequently-accessed elements, computed once at import time.
+
+    Use these on hot paths in place of a per-access `qn()` call, e.g. `elm.find(Tags.a_xfrm)`.
+    Attribute names follow the namespace-prefixed tag with the colon replaced by an underscore.
+    """
+
+    a_ext = qn("a:ext")
+    a_off = qn("a:off")
+    a_xfrm = qn("a:xfrm")
+    p_contentPart = qn("p:contentPart")
+    p_cxnSp = qn("p:cxnSp")
+    p_embed = qn("p:embed")
+    p_graphicFrame = qn("p:graphicFrame")
+    p_grpSp = qn("p:grpSp")
+    p_nvPr = qn("p:nvPr")
+    p_ph = qn("p:ph")
+    p_pic = qn("p:pic")
+    p_sp = qn("p:sp")
+    p_txBody = qn("p:txBody")
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, cast
 
 from pptx.oxml import parse_xml
 from pptx.oxml.chart.chart import CT_Chart
-from pptx.oxml.ns import nsdecls
+from pptx.oxml.ns import Tags, nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import XsdBoolean, XsdString
 from pptx.oxml.table import CT_Table
@@ -339,4 +339,4 @@ class CT_OleObject(BaseOxmlElement):
     @property
     def is_embedded(self) -> bool:
         """True when this OLE object is embedded, False when it is linked."""
-        return len(self.xpath("./p:embed")) > 0
+        return self.find(Tags.p_embed) is not None
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Callable, Iterator
 
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
 from pptx.oxml import parse_xml
-from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.ns import Tags, nsdecls
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
@@ -18,7 +18,8 @@ from pptx.util import Emu
 if TYPE_CHECKING:
     from pptx.enum.shapes import PP_PLACEHOLDER
     from pptx.oxml.shapes import ShapeElement
-    from pptx.oxml.shapes.shared import CT_Transform2D
+    from pptx.oxml.shapes.shared import CT_Point2D, CT_PositiveSize2D, CT_Transform2D
+    from pptx.util import Length
 
 
 class CT_GroupShape(BaseShapeElement):
@@ -32,12 +33,12 @@ class CT_GroupShape(BaseShapeElement):
     )
 
     _shape_tags = (
-        qn("p:sp"),
-        qn("p:grpSp"),
-        qn("p:graphicFrame"),
-        qn("p:cxnSp"),
-        qn("p:pic"),
-        qn("p:contentPart"),
+        Tags.p_sp,
+        Tags.p_grpSp,
+        Tags.p_graphicFrame,
+        Tags.p_cxnSp,
+        Tags.p_pic,
+        Tags.p_contentPart,
     )
 
     def add_autoshape(
@@ -119,12 +120,12 @@ class CT_GroupShape(BaseShapeElement):
         return sp
 
     @property
-    def chExt(self):
+    def chExt(self) -> CT_PositiveSize2D:
         """Descendent `p:grpSpPr/a:xfrm/a:chExt` element."""
         return self.grpSpPr.get_or_add_xfrm().get_or_add_chExt()
 
     @property
-    def chOff(self):
+    def chOff(self) -> CT_Point2D:
         """Descendent `p:grpSpPr/a:xfrm/a:chOff` element."""
         return self.grpSpPr.get_or_add_xfrm().get_or_add_chOff()
 
@@ -194,15 +195,15 @@ class CT_GroupShape(BaseShapeElement):
         This method is recursive "upwards" since a change in a group shape
         can change the position and size of its containing group.
         """
-        if not self.tag == qn("p:grpSp"):
+        if not self.tag == Tags.p_grpSp:
             return
 
         x, y, cx, cy = self._child_extents
 
-        self.chOff.x = self.x = x
-        self.chOff.y = self.y = y
-        self.chExt.cx = self.cx = cx
-        self.chExt.cy = self.cy = cy
+        chOff, chExt = self.chOff, self.chExt
+        chOff.x, chOff.y = x, y
+        chExt.cx, chExt.cy = cx, cy
+        self.set_pos_size(x, y, cx, cy)
         self.getparent().recalculate_extents()
 
     @property
@@ -211,25 +212,30 @@ class CT_GroupShape(BaseShapeElement):
         return self.grpSpPr.xfrm
 
     @property
-    def _child_extents(self) -> tuple[int, int, int, int]:
+    def _child_extents(self) -> tuple[Length, Length, Length, Length]:
         """(x, y, cx, cy) tuple representing net position and size.
 
-        The values are formed as a composite of the contained child shapes.
+        The values are formed as a composite of the contained child shapes. A child shape missing
+        any of its offset or extent values is skipped.
         """
-        child_shape_elms = list(self.iter_shape_elms())
+        extents = [
+            (x, y, cx, cy)
+            for x, y, cx, cy in (xSp.get_pos_size() for xSp in self.iter_shape_elms())
+            if x is not None and y is not None and cx is not None and cy is not None
+        ]
 
-        if not child_shape_elms:
+        if not extents:
             return Emu(0), Emu(0), Emu(0), Emu(0)
 
-        min_x = min([xSp.x for xSp in child_shape_elms])
-        min_y = min([xSp.y for xSp in child_shape_elms])
-        max_x = max([(xSp.x + xSp.cx) for xSp in child_shape_elms])
-        max_y = max([(xSp.y + xSp.cy) for xSp in child_shape_elms])
+        min_x = min([x for x, _, _, _ in extents])
+        min_y = min([y for _, y, _, _ in extents])
+        max_x = max([(x + cx) for x, _, cx, _ in extents])
+        max_y = max([(y + cy) for _, y, _, cy in extents])
 
-        x = min_x
-        y = min_y
-        cx = max_x - min_x
-        cy = max_y - min_y
+        x = Emu(min_x)
+        y = Emu(min_y)
+        cx = Emu(max_x - min_x)
+        cy = Emu(max_y - min_y)
 
         return x, y, cx, cy
 
@@ -243,7 +249,7 @@ class CT_GroupShape(BaseShapeElement):
         element itself is always assigned id="1".
         """
         id_str_lst = self.xpath("//@id")
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
+        used_ids = {int(id_str) for id_str in id_str_lst if id_str.isdigit()}
         for n in range(1, len(used_ids) + 2):
             if n not in used_ids:
                 return n
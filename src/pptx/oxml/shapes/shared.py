@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable, cast
 
-from pptx.dml.fill import CT_GradientFillProperties
 from pptx.enum.shapes import PP_PLACEHOLDER
-from pptx.oxml.ns import qn
+from pptx.exc import InvalidXmlError
+from pptx.oxml.dml.fill import CT_GradientFillProperties
+from pptx.oxml.ns import Tags
 from pptx.oxml.simpletypes import (
     ST_Angle,
     ST_Coordinate,
@@ -28,7 +29,7 @@ from pptx.oxml.xmlchemy import (
     ZeroOrOne,
     ZeroOrOneChoice,
 )
-from pptx.util import Emu
+from pptx.util import Emu, lazyproperty
 
 if TYPE_CHECKING:
     from pptx.oxml.action import CT_Hyperlink
@@ -43,35 +44,39 @@ class BaseShapeElement(BaseOxmlElement):
 
     @property
     def cx(self) -> Length:
-        return self._get_xfrm_attr("cx")
+        xfrm = self.xfrm
+        return None if xfrm is None else xfrm.cx
 
     @cx.setter
     def cx(self, value):
-        self._set_xfrm_attr("cx", value)
+        self.get_or_add_xfrm().cx = value
 
     @property
     def cy(self) -> Length:
-        return self._get_xfrm_attr("cy")
+        xfrm = self.xfrm
+        return None if xfrm is None else xfrm.cy
 
     @cy.setter
     def cy(self, value):
-        self._set_xfrm_attr("cy", value)
+        self.get_or_add_xfrm().cy = value
 
     @property
     def flipH(self):
-        return bool(self._get_xfrm_attr("flipH"))
+        xfrm = self.xfrm
+        return False if xfrm is None else xfrm.flipH
 
     @flipH.setter
     def flipH(self, value):
-        self._set_xfrm_attr("flipH", value)
+        self.get_or_add_xfrm().flipH = value
 
     @property
     def flipV(self):
-        return bool(self._get_xfrm_attr("flipV"))
+        xfrm = self.xfrm
+        return False if xfrm is None else xfrm.flipV
 
     @flipV.setter
     def flipV(self, value):
-        self._set_xfrm_attr("flipV", value)
+        self.get_or_add_xfrm().flipV = value
 
     def get_or_add_xfrm(self):
         """Return the `a:xfrm` grandchild element, newly-added if not present.
@@ -81,21 +86,27 @@ class BaseShapeElement(BaseOxmlElement):
         """
         return self.spPr.get_or_add_xfrm()
 
+    def get_pos_size(self) -> tuple[Length | None, Length | None, Length | None, Length | None]:
+        """(x, y, cx, cy) tuple of this shape's position and size, each |None| when not present."""
+        xfrm = self.xfrm
+        if xfrm is None:
+            return None, None, None, None
+        return xfrm.get_pos_size()
+
     @property
     def has_ph_elm(self):
         """
         True if this shape element has a `p:ph` descendant, indicating it
         is a placeholder shape. False otherwise.
         """
-        return self.ph is not None
+        nvPr = self._nvPr
+        return nvPr is not None and nvPr.find(Tags.p_ph) is not None
 
     @property
     def ph(self) -> CT_Placeholder | None:
         """The `p:ph` descendant element if there is one, None otherwise."""
-        ph_elms = self.xpath("./*[1]/p:nvPr/p:ph")
-        if len(ph_elms) == 0:
-            return None
-        return ph_elms[0]
+        nvPr = self._nvPr
+        return None if nvPr is None else cast("CT_Placeholder | None", nvPr.find(Tags.p_ph))
 
     @property
     def ph_idx(self) -> int:
@@ -103,10 +114,7 @@ class BaseShapeElement(BaseOxmlElement):
 
         Raises |ValueError| if shape is not a placeholder.
         """
-        ph = self.ph
-        if ph is None:
-            raise ValueError("not a placeholder shape")
-        return ph.idx
+        return self._ph_or_raise().idx
 
     @property
     def ph_orient(self) -> str:
@@ -114,10 +122,7 @@ class BaseShapeElement(BaseOxmlElement):
 
         Raises |ValueError| if shape is not a placeholder.
         """
-        ph = self.ph
-        if ph is None:
-            raise ValueError("not a placeholder shape")
-        return ph.orient
+        return self._ph_or_raise().orient
 
     @property
     def ph_sz(self) -> str:
@@ -125,10 +130,7 @@ class BaseShapeElement(BaseOxmlElement):
 
         Raises `ValueError` if shape is not a placeholder.
         """
-        ph = self.ph
-        if ph is None:
-            raise ValueError("not a placeholder shape")
-        return ph.sz
+        return self._ph_or_raise().sz
 
     @property
     def ph_type(self):
@@ -136,56 +138,67 @@ class BaseShapeElement(BaseOxmlElement):
 
         Raises `ValueError` if shape is not a placeholder.
         """
-        ph = self.ph
-        if ph is None:
-            raise ValueError("not a placeholder shape")
-        return ph.type
+        return self._ph_or_raise().type
+
+    def ph_info(self) -> tuple[PP_PLACEHOLDER, str, str, int]:
+        """(type, orient, sz, idx) tuple of placeholder properties.
+
+        Raises `ValueError` if shape is not a placeholder.
+        """
+        ph = self._ph_or_raise()
+        return ph.type, ph.orient, ph.sz, ph.idx
 
     @property
     def rot(self) -> float:
         """Float representing degrees this shape is rotated clockwise."""
         xfrm = self.xfrm
-        if xfrm is None or xfrm.rot is None:
-            return 0.0
-        return xfrm.rot
+        return 0.0 if xfrm is None else (xfrm.rot or 0.0)
 
     @rot.setter
     def rot(self, value: float):
         self.get_or_add_xfrm().rot = value
 
+    def set_pos_size(self, x: Length, y: Length, cx: Length, cy: Length) -> None:
+        """Set position and size of this shape, adding `a:xfrm` and its children as needed."""
+        xfrm = self.get_or_add_xfrm()
+        off, ext = xfrm.get_or_add_off(), xfrm.get_or_add_ext()
+        off.x, off.y = x, y
+        ext.cx, ext.cy = cx, cy
+
     @property
     def shape_id(self):
         """
         Integer id of this shape
         """
-        return self._nvXxPr.cNvPr.id
+        return self._cNvPr.id
 
     @property
     def shape_name(self):
         """
         Name of this shape
         """
-        return self._nvXxPr.cNvPr.name
+        return self._cNvPr.name
 
     @property
     def shape_alt_text(self):
         """
         Alt text of this shape
         """
-        return self._nvXxPr.cNvPr.descr
+        return self._cNvPr.descr
 
     @property
     def txBody(self):
         """Child `p:txBody` element, None if not present."""
-        return self.find(qn("p:txBody"))
+        return self.find(Tags.p_txBody)
 
     @property
     def x(self) -> Length:
-        return self._get_xfrm_attr("x")
+        xfrm = self.xfrm
+        return None if xfrm is None else xfrm.x
 
     @x.setter
     def x(self, value):
-        self._set_xfrm_attr("x", value)
+        self.get_or_add_xfrm().x = value
 
     @property
     def xfrm(self):
@@ -198,30 +211,48 @@ class BaseShapeElement(BaseOxmlElement):
 
     @property
     def y(self) -> Length:
-        return self._get_xfrm_attr("y")
+        xfrm = self.xfrm
+        return None if xfrm is None else xfrm.y
 
     @y.setter
     def y(self, value):
-        self._set_xfrm_attr("y", value)
+        self.get_or_add_xfrm().y = value
+
+    @lazyproperty
+    def _cNvPr(self) -> CT_NonVisualDrawingProps:
+        """Required `p:cNvPr` grandchild of this shape, cached per element proxy."""
+        return self._nvXxPr.cNvPr
 
     @property
-    def _nvXxPr(self):
+    def _nvPr(self) -> CT_ApplicationNonVisualDrawingProps | None:
+        """The `p:nvPr` grandchild element, |None| if not present."""
+        try:
+            nvXxPr = self._nvXxPr
+        except InvalidXmlError:
+            return None
+        return cast("CT_ApplicationNonVisualDrawingProps | None", nvXxPr.find(Tags.p_nvPr))
+
+    @lazyproperty
+    def _nvXxPr(self) -> Any:
         """
         Required non-visual shape properties element for this shape. Actual
         name depends on the shape type, e.g. `p:nvPicPr` for picture
-        shape.
+        shape. The value is cached per element proxy.
         """
-        return self.xpath("./*[1]")[0]
+        nvXxPr = next(self.iterchildren("*"), None)
+        if nvXxPr is None:
+            raise InvalidXmlError("shape element has no non-visual properties child")
+        return nvXxPr
 
-    def _get_xfrm_attr(self, name: str) -> Length | None:
-        xfrm = self.xfrm
-        if xfrm is None:
-            return None
-        return getattr(xfrm, name)
+    def _ph_or_raise(self) -> CT_Placeholder:
+        """The `p:ph` descendant element.
 
-    def _set_xfrm_attr(self, name, value):
-        xfrm = self.get_or_add_xfrm()
-        setattr(xfrm, name, value)
+        Raises `ValueError` if shape is not a placeholder.
+        """
+        ph = self.ph
+        if ph is None:
+            raise ValueError("not a placeholder shape")
+        return ph
 
 
 class CT_ApplicationNonVisualDrawingProps(BaseOxmlElement):
@@ -345,8 +376,12 @@ class CT_PositiveSize2D(BaseOxmlElement):
     Custom element class for <a:ext> element.
     """
 
-    cx = RequiredAttribute("cx", ST_PositiveCoordinate)
-    cy = RequiredAttribute("cy", ST_PositiveCoordinate)
+    cx: Length = RequiredAttribute(  # pyright: ignore[reportAssignmentType]
+        "cx", ST_PositiveCoordinate
+    )
+    cy: Length = RequiredAttribute(  # pyright: ignore[reportAssignmentType]
+        "cy", ST_PositiveCoordinate
+    )
 
 
 class CT_ShapeProperties(BaseOxmlElement):
@@ -408,20 +443,20 @@ class CT_ShapeProperties(BaseOxmlElement):
         """
         Shape width as an instance of Emu, or None if not present.
         """
-        cx_str_lst = self.xpath("./a:xfrm/a:ext/@cx")
-        if not cx_str_lst:
-            return None
-        return Emu(cx_str_lst[0])
+        xfrm = self.find(Tags.a_xfrm)
+        ext = None if xfrm is None else xfrm.find(Tags.a_ext)
+        cx_str = None if ext is None else ext.get("cx")
+        return None if cx_str is None else ST_PositiveCoordinate.convert_from_xml(cx_str)
 
     @property
     def cy(self):
         """
         Shape height as an instance of Emu, or None if not present.
         """
-        cy_str_lst = self.xpath("./a:xfrm/a:ext/@cy")
-        if not cy_str_lst:
-            return None
-        return Emu(cy_str_lst[0])
+        xfrm = self.find(Tags.a_xfrm)
+        ext = None if xfrm is None else xfrm.find(Tags.a_ext)
+        cy_str = None if ext is None else ext.get("cy")
+        return None if cy_str is None else ST_PositiveCoordinate.convert_from_xml(cy_str)
 
     @property
     def x(self) -> Length | None:
@@ -429,10 +464,10 @@ class CT_ShapeProperties(BaseOxmlElement):
 
         0 if not present.
         """
-        x_str_lst = self.xpath("./a:xfrm/a:off/@x")
-        if not x_str_lst:
-            return None
-        return Emu(x_str_lst[0])
+        xfrm = self.find(Tags.a_xfrm)
+        off = None if xfrm is None else xfrm.find(Tags.a_off)
+        x_str = None if off is None else off.get("x")
+        return None if x_str is None else ST_Coordinate.convert_from_xml(x_str)
 
     @property
     def y(self):
@@ -440,10 +475,10 @@ class CT_ShapeProperties(BaseOxmlElement):
         The offset of the top of the shape from the top of the slide, as an
         instance of Emu. None if not present.
         """
-        y_str_lst = self.xpath("./a:xfrm/a:off/@y")
-        if not y_str_lst:
-            return None
-        return Emu(y_str_lst[0])
+        xfrm = self.find(Tags.a_xfrm)
+        off = None if xfrm is None else xfrm.find(Tags.a_off)
+        y_str = None if off is None else off.get("y")
+        return None if y_str is None else ST_Coordinate.convert_from_xml(y_str)
 
     def _new_gradFill(self):
         return CT_GradientFillProperties.new_gradFill()
@@ -456,13 +491,24 @@ class CT_Transform2D(BaseOxmlElement):
     with the `a:xfrm` tag in a group shape (including a slide `p:spTree`).
     """
 
+    get_or_add_off: Callable[[], CT_Point2D]
+    get_or_add_ext: Callable[[], CT_PositiveSize2D]
+    get_or_add_chOff: Callable[[], CT_Point2D]
+    get_or_add_chExt: Callable[[], CT_PositiveSize2D]
+
     _tag_seq = ("a:off", "a:ext", "a:chOff", "a:chExt")
     off: CT_Point2D | None = ZeroOrOne(  # pyright: ignore[reportAssignmentType]
         "a:off", successors=_tag_seq[1:]
     )
-    ext = ZeroOrOne("a:ext", successors=_tag_seq[2:])
-    chOff = ZeroOrOne("a:chOff", successors=_tag_seq[3:])
-    chExt = ZeroOrOne("a:chExt", successors=_tag_seq[4:])
+    ext: CT_PositiveSize2D | None = ZeroOrOne(  # pyright: ignore[reportAssignmentType]
+        "a:ext", successors=_tag_seq[2:]
+    )
+    chOff: CT_Point2D | None = ZeroOrOne(  # pyright: ignore[reportAssignmentType]
+        "a:chOff", successors=_tag_seq[3:]
+    )
+    chExt: CT_PositiveSize2D | None = ZeroOrOne(  # pyright: ignore[reportAssignmentType]
+        "a:chExt", successors=_tag_seq[4:]
+    )
     del _tag_seq
     rot: float | None = OptionalAttribute(  # pyright: ignore[reportAssignmentType]
         "rot", ST_Angle, default=0.0
@@ -518,6 +564,17 @@ class CT_Transform2D(BaseOxmlElement):
         ext = self.get_or_add_ext()
         ext.cy = value
 
+    def get_pos_size(self) -> tuple[Length | None, Length | None, Length | None, Length | None]:
+        """(x, y, cx, cy) tuple of offset and extents, each |None| when not present.
+
+        `a:off` and `a:ext` are each looked up only once, so this is cheaper than reading the four
+        individual properties when more than one of them is needed.
+        """
+        off, ext = self.off, self.ext
+        x, y = (None, None) if off is None else (off.x, off.y)
+        cx, cy = (None, None) if ext is None else (ext.cx, ext.cy)
+        return x, y, cx, cy
+
     def _new_ext(self):
         ext = OxmlElement("a:ext")
         ext.cx = 0
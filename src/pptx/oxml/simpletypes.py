@@ -9,6 +9,7 @@ attributes. Naming generally corresponds to the simple type in the associated XM
 
 from __future__ import annotations
 
+import functools
 import numbers
 from typing import Any
 
@@ -16,6 +17,16 @@ from pptx.exc import InvalidXmlError
 from pptx.util import Centipoints, Emu
 
 
+@functools.lru_cache(maxsize=1024)
+def _emu_from_str(str_value: str) -> Emu:
+    """Emu instance for integer attribute-value string `str_value`.
+
+    Cached because the same few offset and extent values recur across the shapes, layouts, and
+    masters of a presentation; `Emu` is immutable so instances are safely shared.
+    """
+    return Emu(int(str_value))
+
+
 class BaseSimpleType:
     @classmethod
     def from_xml(cls, xml_value: str) -> Any:
@@ -299,10 +310,10 @@ class ST_ContentType(XsdString):
 
 class ST_Coordinate(BaseSimpleType):
     @classmethod
-    def convert_from_xml(cls, str_value):
+    def convert_from_xml(cls, str_value: str) -> Emu:
         if "i" in str_value or "m" in str_value or "p" in str_value:
             return ST_UniversalMeasure.convert_from_xml(str_value)
-        return Emu(int(str_value))
+        return _emu_from_str(str_value)
 
     @classmethod
     def convert_to_xml(cls, value):
@@ -540,9 +551,8 @@ class ST_PlaceholderSize(XsdTokenEnumeration):
 
 class ST_PositiveCoordinate(XsdLong):
     @classmethod
-    def convert_from_xml(cls, str_value):
-        int_value = super(ST_PositiveCoordinate, cls).convert_from_xml(str_value)
-        return Emu(int_value)
+    def convert_from_xml(cls, str_value: str) -> Emu:
+        return _emu_from_str(str_value)
 
     @classmethod
     def validate(cls, value):
@@ -725,7 +735,7 @@ class ST_TextWrappingType(XsdTokenEnumeration):
 
 class ST_UniversalMeasure(BaseSimpleType):
     @classmethod
-    def convert_from_xml(cls, str_value):
+    def convert_from_xml(cls, str_value: str) -> Emu:
         float_part, units_part = str_value[:-2], str_value[-2:]
         quantity = float(float_part)
         multiplier = {
@@ -157,8 +157,8 @@ class BaseAttribute:
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
-    def _clark_name(self):
+    @lazyproperty
+    def _clark_name(self) -> str:
         if ":" in self._attr_name:
             return qn(self._attr_name)
         return self._attr_name
@@ -202,11 +202,14 @@ class OptionalAttribute(BaseAttribute):
     def _getter(self) -> Callable[[BaseOxmlElement], Any]:
         """Callable suitable for the "get" side of the attribute property descriptor."""
 
+        # -- bind these once so each access is just an attribute read and a conversion --
+        clark_name, default, from_xml = self._clark_name, self._default, self._simple_type.from_xml
+
         def get_attr_value(obj: BaseOxmlElement) -> Any:
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -215,15 +218,17 @@ class OptionalAttribute(BaseAttribute):
     def _setter(self) -> Callable[[BaseOxmlElement, Any], None]:
         """Callable suitable for the "set" side of the attribute property descriptor."""
 
+        clark_name, default, to_xml = self._clark_name, self._default, self._simple_type.to_xml
+
         def set_attr_value(obj: BaseOxmlElement, value: Any) -> None:
             # -- when an XML attribute has a default value, setting it to that default removes the
             # -- attribute from the element (when it is present)
-            if value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value == default:
+                if clark_name in obj.attrib:
+                    del obj.attrib[clark_name]
                 return
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = to_xml(value)
+            obj.set(clark_name, str_value)
 
         return set_attr_value
 
@@ -241,13 +246,15 @@ class RequiredAttribute(BaseAttribute):
     def _getter(self) -> Callable[[BaseOxmlElement], Any]:
         """Callable suitable for the "get" side of the attribute property descriptor."""
 
+        clark_name, from_xml = self._clark_name, self._simple_type.from_xml
+
         def get_attr_value(obj: BaseOxmlElement) -> Any:
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" % (self._attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -267,9 +274,11 @@ class RequiredAttribute(BaseAttribute):
     def _setter(self) -> Callable[[BaseOxmlElement, Any], None]:
         """Callable suitable for the "set" side of the attribute property descriptor."""
 
+        clark_name, to_xml = self._clark_name, self._simple_type.to_xml
+
         def set_attr_value(obj: BaseOxmlElement, value: Any) -> None:
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = to_xml(value)
+            obj.set(clark_name, str_value)
 
         return set_attr_value
 
@@ -355,6 +364,14 @@ class _BaseChildElement:
     def _add_method_name(self):
         return "_add_%s" % self._prop_name
 
+    @lazyproperty
+    def _clark_name(self) -> str:
+        """Clark-notation tag name of this child element, e.g. "{http://...}xfrm".
+
+        Computed once so generated accessors don't call `qn()` on every access.
+        """
+        return qn(self._nsptagname)
+
     def _add_to_class(self, name: str, method: Callable[..., Any]):
         """Add `method` to the target class as `name`, unless `name` is already defined there."""
         if hasattr(self._element_cls, name):
@@ -378,8 +395,10 @@ class _BaseChildElement:
         present.
         """
 
+        clark_name = self._clark_name
+
         def get_child_element(obj: BaseOxmlElement) -> BaseOxmlElement | None:
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
 
         get_child_element.__doc__ = (
             "``<%s>`` child element or |None| if not present." % self._nsptagname
@@ -394,8 +413,10 @@ class _BaseChildElement:
     def _list_getter(self) -> Callable[[BaseOxmlElement], list[BaseOxmlElement]]:
         """Callable suitable for the "get" side of a list property descriptor."""
 
+        clark_name = self._clark_name
+
         def get_child_element_list(obj: BaseOxmlElement) -> list[BaseOxmlElement]:
-            return cast("list[BaseOxmlElement]", obj.findall(qn(self._nsptagname)))
+            return cast("list[BaseOxmlElement]", obj.findall(clark_name))
 
         get_child_element_list.__doc__ = (
             "A list containing each of the ``<%s>`` child elements, in the o"
@@ -488,8 +509,10 @@ class OneAndOnlyOne(_BaseChildElement):
     def _getter(self) -> Callable[[BaseOxmlElement], BaseOxmlElement]:
         """Callable suitable for the "get" side of the property descriptor."""
 
+        clark_name = self._clark_name
+
         def get_child_element(obj: BaseOxmlElement) -> BaseOxmlElement:
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" % self._nsptagname
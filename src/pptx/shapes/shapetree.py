@@ -9,7 +9,7 @@ from typing import IO, TYPE_CHECKING, Callable, Iterable, Iterator, cast
 from pptx.enum.shapes import PP_PLACEHOLDER, PROG_ID
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
 from pptx.opc.constants import CONTENT_TYPE as CT
-from pptx.oxml.ns import qn
+from pptx.oxml.ns import Tags
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
@@ -111,7 +111,7 @@ class _BaseShapes(ParentedElementProxy):
     def clone_placeholder(self, placeholder: LayoutPlaceholder) -> None:
         """Add a new placeholder shape based on `placeholder`."""
         sp = placeholder.element
-        ph_type, orient, sz, idx = (sp.ph_type, sp.ph_orient, sp.ph_sz, sp.ph_idx)
+        ph_type, orient, sz, idx = sp.ph_info()
         id_ = self._next_shape_id
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
@@ -811,10 +811,10 @@ def BaseShapeFactory(shape_elm: ShapeElement, parent: ProvidesPart) -> BaseShape
         return Picture(shape_elm, parent)
 
     shape_cls = {
-        qn("p:cxnSp"): Connector,
-        qn("p:grpSp"): GroupShape,
-        qn("p:sp"): Shape,
-        qn("p:graphicFrame"): GraphicFrame,
+        Tags.p_cxnSp: Connector,
+        Tags.p_grpSp: GroupShape,
+        Tags.p_sp: Shape,
+        Tags.p_graphicFrame: GraphicFrame,
     }.get(tag, BaseShape)
 
     return shape_cls(shape_elm, parent)  # pyright: ignore[reportArgumentType]
@@ -844,16 +844,16 @@ def _NotesSlideShapeFactory(shape_elm: ShapeElement, parent: ProvidesPart) -> Ba
 def _SlidePlaceholderFactory(shape_elm: ShapeElement, parent: ProvidesPart):
     """Return a placeholder shape of the appropriate type for `shape_elm`."""
     tag = shape_elm.tag
-    if tag == qn("p:sp"):
+    if tag == Tags.p_sp:
         Constructor = {
             PP_PLACEHOLDER.BITMAP: PicturePlaceholder,
             PP_PLACEHOLDER.CHART: ChartPlaceholder,
             PP_PLACEHOLDER.PICTURE: PicturePlaceholder,
             PP_PLACEHOLDER.TABLE: TablePlaceholder,
         }.get(shape_elm.ph_type, SlidePlaceholder)
-    elif tag == qn("p:graphicFrame"):
+    elif tag == Tags.p_graphicFrame:
         Constructor = PlaceholderGraphicFrame
-    elif tag == qn("p:pic"):
+    elif tag == Tags.p_pic:
         Constructor = PlaceholderPicture
     else:
         Constructor = BaseShapeFactory
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import pytest
 
-from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
+from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame, CT_OleObject
 
-from ...unitutil.cxml import xml
+from ...unitutil.cxml import element, xml
 
 CHART_URI = "http://schemas.openxmlformats.org/drawingml/2006/chart"
 TABLE_URI = "http://schemas.openxmlformats.org/drawingml/2006/table"
@@ -78,3 +78,20 @@ class DescribeCT_GraphicalObjectFrame(object):
             "h=4}/a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p),a:tcPr)))" % TABLE_URI
         )
         return id_, name, rows, cols, x, y, cx, cy, expected_xml
+
+
+class DescribeCT_OleObject(object):
+    """Unit-test suite for `pptx.oxml.shapes.graphfrm.CT_OleObject`."""
+
+    @pytest.mark.parametrize(
+        ("cxml", "expected_value"),
+        [
+            ("p:oleObj/p:embed", True),
+            ("p:oleObj/p:link", False),
+            ("p:oleObj", False),
+        ],
+    )
+    def it_knows_whether_it_is_embedded(self, cxml: str, expected_value: bool):
+        oleObj = element(cxml)
+        assert isinstance(oleObj, CT_OleObject)
+        assert oleObj.is_embedded is expected_value
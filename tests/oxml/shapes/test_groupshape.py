@@ -212,6 +212,12 @@ class DescribeCT_GroupShape(object):
                 "spPr/a:xfrm/(a:off{x=150,y=75},a:ext{cx=25,cy=25}))",
                 (50, 50, 125, 75),
             ),
+            (
+                "p:grpSp/(p:sp/p:spPr/a:xfrm/(a:off{x=500,y=500},a:ext{cx=10,cy=10}),p:sp"
+                "/p:spPr,p:sp/p:spPr/a:xfrm/a:ext{cx=3,cy=4})",
+                (500, 500, 10, 10),
+            ),
+            ("p:grpSp/(p:sp/p:spPr,p:sp/p:spPr/a:xfrm/a:off{x=1,y=2})", (0, 0, 0, 0)),
         ]
     )
     def child_exts_fixture(self, request):
@@ -0,0 +1,156 @@
+"""Unit-test suite for `pptx.oxml.shapes.shared` module."""
+
+from __future__ import annotations
+
+import pytest
+
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.exc import InvalidXmlError
+from pptx.oxml.shapes.shared import BaseShapeElement, CT_ShapeProperties, CT_Transform2D
+from pptx.util import Emu
+
+from ...unitutil.cxml import element, xml
+
+
+class DescribeBaseShapeElement(object):
+    """Unit-test suite for `pptx.oxml.shapes.shared.BaseShapeElement` objects."""
+
+    @pytest.mark.parametrize(
+        ("cxml", "expected_value"),
+        [
+            ("p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1}", True),
+            ("p:pic/p:nvPicPr/p:nvPr/p:ph{idx=2}", True),
+            ("p:sp/p:nvSpPr/p:nvPr", False),
+            ("p:sp/p:nvSpPr", False),
+            ("p:sp/(p:nvSpPr,p:spPr/p:nvPr/p:ph)", False),
+        ],
+    )
+    def it_knows_its_ph_element(self, cxml: str, expected_value: bool):
+        shape_elm = element(cxml)
+        assert isinstance(shape_elm, BaseShapeElement)
+        assert (shape_elm.ph is not None) is expected_value
+        assert shape_elm.has_ph_elm is expected_value
+
+    @pytest.mark.parametrize(
+        ("cxml", "expected_flipH", "expected_flipV"),
+        [
+            ("p:sp/(p:nvSpPr,p:spPr)", False, False),
+            ("p:sp/(p:nvSpPr,p:spPr/a:xfrm)", False, False),
+            ("p:sp/(p:nvSpPr,p:spPr/a:xfrm{flipH=1})", True, False),
+            ("p:cxnSp/(p:nvCxnSpPr,p:spPr/a:xfrm{flipH=0,flipV=true})", False, True),
+        ],
+    )
+    def it_knows_its_flip_settings(self, cxml: str, expected_flipH: bool, expected_flipV: bool):
+        shape_elm = element(cxml)
+        assert isinstance(shape_elm, BaseShapeElement)
+        assert shape_elm.flipH is expected_flipH
+        assert shape_elm.flipV is expected_flipV
+
+    @pytest.mark.parametrize(
+        ("cxml", "expected_value"),
+        [
+            ("p:sp/(p:nvSpPr,p:spPr/a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4}))", (1, 2, 3, 4)),
+            ("p:pic/(p:nvPicPr,p:blipFill,p:spPr/a:xfrm/a:off{x=5,y=6})", (5, 6, None, None)),
+            ("p:sp/(p:nvSpPr,p:spPr)", (None, None, None, None)),
+        ],
+    )
+    def it_can_get_its_position_and_size_in_one_call(
+        self, cxml: str, expected_value: tuple[int | None, int | None, int | None, int | None]
+    ):
+        shape_elm = element(cxml)
+        assert isinstance(shape_elm, BaseShapeElement)
+        assert shape_elm.get_pos_size() == expected_value
+
+    @pytest.mark.parametrize(
+        ("cxml", "expected_cxml"),
+        [
+            (
+                "p:sp/(p:nvSpPr,p:spPr/a:xfrm)",
+                "p:sp/(p:nvSpPr,p:spPr/a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4}))",
+            ),
+            (
+                "p:sp/(p:nvSpPr,p:spPr/a:xfrm{rot=60000}/a:ext{cx=8,cy=9})",
+                "p:sp/(p:nvSpPr,p:spPr/a:xfrm{rot=60000}/(a:off{x=1,y=2},a:ext{cx=3,cy=4}))",
+            ),
+        ],
+    )
+    def it_can_set_its_position_and_size_in_one_call(self, cxml: str, expected_cxml: str):
+        shape_elm = element(cxml)
+        assert isinstance(shape_elm, BaseShapeElement)
+        shape_elm.set_pos_size(Emu(1), Emu(2), Emu(3), Emu(4))
+        assert shape_elm.xml == xml(expected_cxml)
+
+    def it_can_get_its_placeholder_properties_in_one_call(self):
+        sp = element("p:sp/p:nvSpPr/p:nvPr/p:ph{type=chart,idx=42,orient=vert,sz=half}")
+        assert isinstance(sp, BaseShapeElement)
+        assert sp.ph_info() == (PP_PLACEHOLDER.CHART, "vert", "half", 42)
+
+    def but_it_raises_on_placeholder_property_access_when_not_a_placeholder(self):
+        sp = element("p:sp/p:nvSpPr/p:nvPr")
+        assert isinstance(sp, BaseShapeElement)
+        with pytest.raises(ValueError, match="not a placeholder shape"):
+            sp.ph_info()
+        with pytest.raises(ValueError, match="not a placeholder shape"):
+            sp.ph_idx
+
+    def it_caches_its_nvXxPr_and_cNvPr_elements(self):
+        sp = element("p:sp/(p:nvSpPr/p:cNvPr{id=42,name=Foo,descr=Bar},p:spPr)")
+        assert isinstance(sp, BaseShapeElement)
+
+        nvXxPr = sp._nvXxPr  # pyright: ignore[reportPrivateUsage]
+        cNvPr = sp._cNvPr  # pyright: ignore[reportPrivateUsage]
+
+        assert nvXxPr is sp[0]
+        assert "_nvXxPr" in sp.__dict__
+        assert cNvPr is nvXxPr[0]
+        assert "_cNvPr" in sp.__dict__
+        assert sp.shape_id == 42
+        assert sp.shape_name == "Foo"
+        assert sp.shape_alt_text == "Bar"
+
+    def but_it_raises_on_shape_id_access_when_it_has_no_nvXxPr_element(self):
+        sp = element("p:sp")
+        assert isinstance(sp, BaseShapeElement)
+        with pytest.raises(InvalidXmlError, match="no non-visual properties child"):
+            sp.shape_id
+
+
+class DescribeCT_ShapeProperties(object):
+    """Unit-test suite for `pptx.oxml.shapes.shared.CT_ShapeProperties` objects."""
+
+    @pytest.mark.parametrize(
+        ("cxml", "expected_value"),
+        [
+            ("p:spPr/a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4})", (1, 2, 3, 4)),
+            ("p:spPr/a:xfrm/a:off{x=5,y=6}", (5, 6, None, None)),
+            ("p:spPr/a:xfrm/a:ext{cx=7,cy=8}", (None, None, 7, 8)),
+            ("p:spPr/a:xfrm", (None, None, None, None)),
+            ("p:spPr", (None, None, None, None)),
+        ],
+    )
+    def it_knows_its_position_and_size(
+        self, cxml: str, expected_value: tuple[int | None, int | None, int | None, int | None]
+    ):
+        spPr = element(cxml)
+        assert isinstance(spPr, CT_ShapeProperties)
+        assert (spPr.x, spPr.y, spPr.cx, spPr.cy) == expected_value
+
+
+class DescribeCT_Transform2D(object):
+    """Unit-test suite for `pptx.oxml.shapes.shared.CT_Transform2D` objects."""
+
+    @pytest.mark.parametrize(
+        ("cxml", "expected_value"),
+        [
+            ("a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4})", (1, 2, 3, 4)),
+            ("a:xfrm/a:off{x=5,y=6}", (5, 6, None, None)),
+            ("a:xfrm/a:ext{cx=7,cy=8}", (None, None, 7, 8)),
+            ("a:xfrm", (None, None, None, None)),
+        ],
+    )
+    def it_can_get_its_position_and_size_in_one_call(
+        self, cxml: str, expected_value: tuple[int | None, int | None, int | None, int | None]
+    ):
+        xfrm = element(cxml)
+        assert isinstance(xfrm, CT_Transform2D)
+        assert xfrm.get_pos_size() == expected_value
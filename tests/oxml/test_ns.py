@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from pptx.oxml.ns import NamespacePrefixedTag, namespaces, nsdecls, nsuri, qn
+from pptx.oxml.ns import NamespacePrefixedTag, Tags, namespaces, nsdecls, nsuri, qn
 
 
 class DescribeNamespacePrefixedTag(object):
@@ -49,6 +49,15 @@ class DescribeQn(object):
         assert qn(nsptag_str) == clark_name
 
 
+class DescribeTags(object):
+    @pytest.mark.parametrize(
+        ("attr_name", "nsptag_str"),
+        [("a_xfrm", "a:xfrm"), ("p_nvPr", "p:nvPr"), ("p_graphicFrame", "p:graphicFrame")],
+    )
+    def it_provides_precomputed_clark_names(self, attr_name: str, nsptag_str: str):
+        assert getattr(Tags, attr_name) == qn(nsptag_str)
+
+
 # ===========================================================================
 # fixtures
 # ===========================================================================
@@ -23,7 +23,9 @@ from pptx.oxml.simpletypes import (
     ST_Coordinate,
     ST_HexColorRGB,
     ST_Percentage,
+    ST_PositiveCoordinate,
 )
+from pptx.util import Emu
 
 from ..unitutil.mock import instance_mock, method_mock
 
@@ -181,6 +183,13 @@ class DescribeST_Coordinate(object):
         str_value, expected_value = univ_meas_fixture
         assert ST_Coordinate.convert_from_xml(str_value) == expected_value
 
+    @pytest.mark.parametrize(("str_value", "expected_value"), [("914400", 914400), ("-42", -42)])
+    def it_can_convert_from_an_integer_string(self, str_value: str, expected_value: int):
+        value = ST_Coordinate.convert_from_xml(str_value)
+
+        assert isinstance(value, Emu)
+        assert value == expected_value
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(
@@ -198,6 +207,14 @@ class DescribeST_Coordinate(object):
         return str_value, expected_value
 
 
+class DescribeST_PositiveCoordinate(object):
+    def it_can_convert_from_xml(self):
+        value = ST_PositiveCoordinate.convert_from_xml("914400")
+
+        assert isinstance(value, Emu)
+        assert value == 914400
+
+
 class DescribeST_HexColorRGB(object):
     def it_can_validate_a_hex_RGB_string(self, valid_fixture):
         str_value, exception = valid_fixture